@@ -4,16 +4,130 @@ import re
 import json
 import csv
 import sys
+from functools import lru_cache
+from itertools import islice
+from multiprocessing import Pool, cpu_count
 from typing import Dict, List, Tuple, Any
 
+# google-re2 gives linear-time matching for the PII patterns when installed.
+# RE2's \d, \w, \s and \b are ASCII-only, so the stdlib fallback compiles with
+# re.ASCII and the non-regex checks below use ASCII classes too: a record is
+# classified the same way whichever backend is present.
+# Patterns that rely on Python-only syntax (such as \Z) stay on stdlib re.
+try:
+    import re2
+    
+    def compile_pii_pattern(pattern):
+        return re2.compile(pattern)
+except ImportError:
+    def compile_pii_pattern(pattern):
+        return re.compile(pattern, re.ASCII)
+
+def stdlib_json_dumps(data):
+    return json.dumps(data, separators=(',', ':'))
+
+# orjson is used for the per-row parse/serialize when installed; the stdlib
+# json module remains the fallback so the script runs without extra packages.
+# json_loads returns the parsed data together with the serializer to write it
+# back with, so a record stdlib had to parse is also serialized by stdlib.
+try:
+    import orjson
+    
+    # orjson silently turns integers beyond 64 bits into floats, so any text
+    # with a 19+ digit run goes through json, which keeps them exact. 19 digits
+    # already covers values just below the int64 minimum.
+    _LONG_DIGIT_RUN_RE = re.compile(r'[0-9]{19}')
+    
+    def orjson_dumps(data):
+        return orjson.dumps(data).decode()
+    
+    def json_loads(text):
+        if _LONG_DIGIT_RUN_RE.search(text):
+            return json.loads(text), stdlib_json_dumps
+        try:
+            return orjson.loads(text), orjson_dumps
+        except orjson.JSONDecodeError:
+            # orjson is stricter than json (NaN, Infinity, lone surrogate
+            # escapes) and would write NaN back as null; only text json also
+            # rejects counts as malformed.
+            return json.loads(text), stdlib_json_dumps
+except ImportError:
+    def json_loads(text):
+        return json.loads(text), stdlib_json_dumps
+
+# Compiled once at import and shared by every FlixkartPIIDetector and the
+# raw-string helpers.
+_PHONE_RE = compile_pii_pattern(r'\b\d{10}\b')
+_AADHAR_RE = compile_pii_pattern(r'\b\d{4}[\s-]?\d{4}[\s-]?\d{4}\b|\b\d{12}\b')
+_PASSPORT_RE = compile_pii_pattern(r'\b[A-Z]\d{7}\b')
+_UPI_RE = compile_pii_pattern(r'\b[\w.]+@[\w.]+\b|\b\d{10}@[a-zA-Z]+\b')
+_EMAIL_RE = compile_pii_pattern(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_NAME_WORD_RE = re.compile(r'[A-Za-z.]+\Z')
+_NON_DIGIT_RE = re.compile(r'[^\d]', re.ASCII)
+_DIGIT_TBL = str.maketrans('', '', '0123456789')
+
+def mask_phone(phone):
+    if len(phone) == 10:
+        return f"{phone[:2]}XXXXXX{phone[-2:]}"
+    return f"{phone[:2]}{'X' * (len(phone) - 4)}{phone[-2:]}"
+
+def mask_aadhar(clean_num):
+    return f"{clean_num[:2]}XXXXXXXX{clean_num[-2:]}"
+
+def mask_word(word):
+    return f"{word[0]}{'X' * (len(word) - 1)}" if len(word) > 1 else 'X'
+
+def mask_name(name):
+    return ' '.join([mask_word(word) for word in name.split()])
+
+# Straight-line shape checks equivalent to fullmatch on the phone, aadhar,
+# passport and UPI patterns, so standalone field checks never enter a regex.
+def is_ascii_digits(value_str):
+    return value_str.isascii() and value_str.isdecimal()
+
+def is_phone(value_str):
+    return len(value_str) == 10 and is_ascii_digits(value_str)
+
+def is_aadhar(value_str):
+    pos = 0
+    for group in range(3):
+        digits = value_str[pos:pos + 4]
+        if len(digits) != 4 or not is_ascii_digits(digits):
+            return False
+        pos += 4
+        if group < 2 and pos < len(value_str) and value_str[pos] in ' \t\n\r\f\v-':
+            pos += 1
+    return pos == len(value_str)
+
+def is_passport(value_str):
+    return len(value_str) == 8 and 'A' <= value_str[0] <= 'Z' and is_ascii_digits(value_str[1:])
+
+def is_word_char(char):
+    return char.isascii() and (char.isalnum() or char == '_')
+
+def is_upi(value_str):
+    user, _, handle = value_str.partition('@')
+    return (bool(user) and bool(handle) and is_word_char(user[0]) and is_word_char(handle[-1])
+            and all(is_word_char(c) or c == '.' for c in user)
+            and all(is_word_char(c) or c == '.' for c in handle))
+
+_STANDALONE_VALIDATORS = {
+    'phone': is_phone,
+    'aadhar': is_aadhar,
+    'passport': is_passport,
+    'upi_id': is_upi,
+}
+
 class FlixkartPIIDetector:
     
     def __init__(self):
-        self.phone_pattern = re.compile(r'\b\d{10}\b')
-        self.aadhar_pattern = re.compile(r'\b\d{4}[\s-]?\d{4}[\s-]?\d{4}\b|\b\d{12}\b')
-        self.passport_pattern = re.compile(r'\b[A-Z]\d{7}\b')
-        self.upi_pattern = re.compile(r'\b[\w.]+@[\w.]+\b|\b\d{10}@[a-zA-Z]+\b')
-        self.email_pattern = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+        self.phone_pattern = _PHONE_RE
+        self.aadhar_pattern = _AADHAR_RE
+        self.passport_pattern = _PASSPORT_RE
+        self.upi_pattern = _UPI_RE
+        self.email_pattern = _EMAIL_RE
+        self._name_word_re = _NAME_WORD_RE
+        self._non_digit_re = _NON_DIGIT_RE
         
         self.name_fields = ['name', 'first_name', 'last_name']
         self.combinatorial_fields = ['name', 'first_name', 'last_name', 'email', 'address', 'device_id', 'ip_address']
@@ -24,19 +138,11 @@ class FlixkartPIIDetector:
             
         value_str = str(value).strip()
         
-        if field == 'phone' or self.phone_pattern.match(value_str):
-            return True
-        
-        if field == 'aadhar' or self.aadhar_pattern.match(value_str):
-            return True
-            
-        if field == 'passport' or self.passport_pattern.match(value_str):
-            return True
-            
-        if field == 'upi_id' or self.upi_pattern.match(value_str):
+        # A standalone PII field name is enough on its own; other fields are
+        # checked against every shape.
+        if field in _STANDALONE_VALIDATORS:
             return True
-            
-        return False
+        return any(validator(value_str) for validator in _STANDALONE_VALIDATORS.values())
     
     def is_valid_name(self, name_str):
         if not name_str or len(name_str.strip()) < 2:
@@ -47,7 +153,7 @@ class FlixkartPIIDetector:
             return False
             
         for word in words:
-            if not re.match(r'^[A-Za-z.]+$', word):
+            if not self._name_word_re.match(word):
                 return False
         
         return True
@@ -59,53 +165,66 @@ class FlixkartPIIDetector:
         if not addr_str or len(str(addr_str)) < 10:
             return False
         addr = str(addr_str)
-        return ',' in addr and (bool(re.search(r'\d', addr)) or len(addr.split()) >= 4)
+        if ',' not in addr:
+            return False
+        # Deleting ASCII digits changes the string iff it has one
+        if addr.translate(_DIGIT_TBL) != addr:
+            return True
+        return len(addr.split()) >= 4
+    
+    def combinatorial_tag(self, field, value):
+        if not value:
+            return None
+        
+        if field in ['name'] and self.is_valid_name(value):
+            return 'name'
+        elif field in ['first_name', 'last_name'] and len(str(value).strip()) >= 2:
+            return 'name_parts'
+        elif field == 'email' and self.is_valid_email(value):
+            return 'email'
+        elif field == 'address' and self.is_valid_address(value):
+            return 'address'
+        elif field in ['device_id', 'ip_address'] and len(str(value).strip()) >= 5:
+            return 'device_info'
+        return None
     
     def has_combinatorial_pii(self, data):
         pii_fields_present = []
         
         for field, value in data.items():
-            if not value:
-                continue
-                
-            if field in ['name'] and self.is_valid_name(value):
-                pii_fields_present.append('name')
-            elif field in ['first_name', 'last_name'] and len(str(value).strip()) >= 2:
-                if 'name_parts' not in pii_fields_present:
-                    pii_fields_present.append('name_parts')
-            elif field == 'email' and self.is_valid_email(value):
-                pii_fields_present.append('email')
-            elif field == 'address' and self.is_valid_address(value):
-                pii_fields_present.append('address')
-            elif field in ['device_id', 'ip_address'] and len(str(value).strip()) >= 5:
-                pii_fields_present.append('device_info')
+            tag = self.combinatorial_tag(field, value)
+            if tag and (tag != 'name_parts' or tag not in pii_fields_present):
+                pii_fields_present.append(tag)
         
         return len(pii_fields_present) >= 2
     
     def detect_pii_in_record(self, data):
         has_standalone = False
-        has_combinatorial = False
         pii_fields = {}
+        pii_fields_present = []
+        combinatorial_candidates = {}
         
+        # Single pass: standalone fields are masked immediately, combinatorial
+        # ones are only masked once we know at least two are present.
         for field, value in data.items():
             if self.is_standalone_pii(field, value):
                 has_standalone = True
                 pii_fields[field] = self.mask_value(field, value)
+            
+            tag = self.combinatorial_tag(field, value)
+            if tag and (tag != 'name_parts' or tag not in pii_fields_present):
+                pii_fields_present.append(tag)
+            
+            if field not in pii_fields and value and (tag or field in ['device_id', 'ip_address']):
+                combinatorial_candidates[field] = value
         
-        if self.has_combinatorial_pii(data):
-            has_combinatorial = True
-            for field, value in data.items():
-                if field in self.combinatorial_fields and value and field not in pii_fields:
-                    if field in ['name'] and self.is_valid_name(value):
-                        pii_fields[field] = self.mask_value(field, value)
-                    elif field in ['first_name', 'last_name'] and len(str(value).strip()) >= 2:
-                        pii_fields[field] = self.mask_value(field, value)
-                    elif field == 'email' and self.is_valid_email(value):
-                        pii_fields[field] = self.mask_value(field, value)
-                    elif field == 'address' and self.is_valid_address(value):
-                        pii_fields[field] = self.mask_value(field, value)
-                    elif field in ['device_id', 'ip_address']:
-                        pii_fields[field] = '[REDACTED]'
+        has_combinatorial = len(pii_fields_present) >= 2
+        if has_combinatorial:
+            for field, value in combinatorial_candidates.items():
+                if field in ['device_id', 'ip_address']:
+                    pii_fields[field] = '[REDACTED]'
+                else:
+                    pii_fields[field] = self.mask_value(field, value)
         
         return has_standalone or has_combinatorial, pii_fields
     
@@ -113,160 +232,231 @@ class FlixkartPIIDetector:
         value_str = str(value).strip()
         
         if field == 'phone' or self.phone_pattern.match(value_str):
-            if len(value_str) == 10:
-                return f"{value_str[:2]}XXXXXX{value_str[-2:]}"
-            return f"{value_str[:2]}{'X' * (len(value_str) - 4)}{value_str[-2:]}"
+            return mask_phone(value_str)
         
         if field == 'aadhar':
-            clean_num = re.sub(r'[^\d]', '', value_str)
+            clean_num = self._non_digit_re.sub('', value_str)
             if len(clean_num) == 12:
-                return f"{clean_num[:2]}XXXXXXXX{clean_num[-2:]}"
+                return mask_aadhar(clean_num)
             return '[REDACTED]'
         
         if field in ['name', 'first_name', 'last_name']:
-            words = value_str.split()
-            masked_words = []
-            for word in words:
-                if len(word) > 1:
-                    masked_words.append(f"{word[0]}{'X' * (len(word) - 1)}")
-                else:
-                    masked_words.append('X')
-            return ' '.join(masked_words)
+            return mask_name(value_str)
         
         if field == 'email':
             if '@' in value_str:
                 user, domain = value_str.split('@', 1)
-                masked_user = f"{user[0]}{'X' * (len(user) - 1)}" if len(user) > 1 else 'X'
-                return f"{masked_user}@{domain}"
+                return f"{mask_word(user)}@{domain}"
             return '[REDACTED]'
         
         return '[REDACTED]'
 
-def fix_malformed_json(json_str):
+_UNQUOTED_IDENT_RE = re.compile(r':\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*([,}])')
+_ISO_DATE_RE = re.compile(r':\s*(\d{4}-\d{2}-\d{2})\s*([,}])')
 
-    import re
+def fix_malformed_json(json_str):
+    fixed = _UNQUOTED_IDENT_RE.sub(r': "\1"\2', json_str.strip().rstrip('"'))
+    return _ISO_DATE_RE.sub(r': "\1"\2', fixed)
 
-    fixed = json_str.strip().rstrip('"')
+# Raw-string PII patterns by name; find_pii_spans scans each one separately
+# and picks its masker by name.
+_RAW_PII_PATTERNS = (
+    ('upi', _UPI_RE),
+    ('email', _EMAIL_RE),
+    ('passport', _PASSPORT_RE),
+    ('aadhar', _AADHAR_RE),
+    ('phone', _PHONE_RE),
+)
+# Detection only: one alternation answers "does anything match" in a single
+# pass. It drops overlapping matches, so it must not drive redaction, and the
+# order of its branches does not matter.
+_RAW_PII_RE = compile_pii_pattern('|'.join(f'(?:{pattern.pattern})' for _, pattern in _RAW_PII_PATTERNS))
 
-    fixed = re.sub(r':\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*([,}])', r': "\1"\2', fixed)
+def mask_raw_aadhar(aadhar):
+    return mask_aadhar(_NON_DIGIT_RE.sub('', aadhar))
 
-    fixed = re.sub(r':\s*(\d{4}-\d{2}-\d{2})\s*([,}])', r': "\1"\2', fixed)
-    return fixed
+# Maskers keyed by _RAW_PII_PATTERNS name; anything else becomes [REDACTED]
+_RAW_PII_MASKERS = {
+    'phone': mask_phone,
+    'aadhar': mask_raw_aadhar,
+}
 
 def detect_pii_in_raw_string(raw_str):
     """Detect PII in raw string when JSON parsing fails"""
-    detector = FlixkartPIIDetector()
-    # Check for phone numbers
-    if detector.phone_pattern.search(raw_str):
-        return True
-    # Check for aadhar numbers  
-    if detector.aadhar_pattern.search(raw_str):
-        return True
-    # Check for passport numbers
-    if detector.passport_pattern.search(raw_str):
-        return True
-    # Check for UPI IDs
-    if detector.upi_pattern.search(raw_str):
-        return True
-    # Check for emails
-    if detector.email_pattern.search(raw_str):
-        return True
-    return False
+    return _RAW_PII_RE.search(raw_str) is not None
+
+def find_pii_spans(raw_str):
+    """Return (start, end, masked) for every PII match, in string order"""
+    # Each pattern is scanned on its own: a single alternation only yields
+    # non-overlapping matches and would leave e.g. the aadhar digits of
+    # 'pay@1234 5678 9012' behind once the UPI match had consumed its prefix.
+    spans = []
+    for name, pattern in _RAW_PII_PATTERNS:
+        masker = _RAW_PII_MASKERS.get(name)
+        for match in pattern.finditer(raw_str):
+            masked = masker(match.group()) if masker else '[REDACTED]'
+            spans.append((match.start(), match.end(), masked))
+    return merge_pii_spans(spans)
+
+def merge_pii_spans(spans):
+    """Merge overlapping (start, end, masked) spans into their union, in string order.
+    
+    A union of several matches is replaced wholesale with [REDACTED], so no
+    part of any overlapping match survives in plain text.
+    """
+    merged = []
+    for start, end, masked in sorted(spans):
+        if merged and start < merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end), '[REDACTED]')
+        else:
+            merged.append((start, end, masked))
+    return merged
 
 def redact_pii_in_raw_string(raw_str):
     """Redact PII in raw string when JSON parsing fails"""
-    import re
-    detector = FlixkartPIIDetector()
-    redacted = raw_str
+    out = []
+    pos = 0
+    for start, end, masked in find_pii_spans(raw_str):
+        out.append(raw_str[pos:start])
+        out.append(masked)
+        pos = end
+    out.append(raw_str[pos:])
+    return ''.join(out)
+
+# Field names that can make a record PII even with no digit or '@' in it
+_PII_FIELD_HINTS = ('name', 'address', 'phone', 'aadhar', 'passport', 'upi_id', 'device_id', 'email')
+
+def could_contain_pii(data_json):
+    """Cheap prefilter: False only when no detection rule can fire on the record"""
+    if '@' in data_json:
+        return True
+    if data_json.translate(_DIGIT_TBL) != data_json:
+        return True
+    return any(hint in data_json for hint in _PII_FIELD_HINTS)
+
+# Shared by process_record; the constructor only binds the module-level
+# patterns, so building it at import is cheap and every pool worker (forked
+# or spawned) ends up with its own ready instance.
+_detector = FlixkartPIIDetector()
+
+# Keyed on the raw data_json text, so duplicate records skip both the JSON
+# parse and the PII scan. Each pool worker keeps its own cache.
+@lru_cache(maxsize=100_000)
+def process_record(data_json):
+    """Return (redacted_data_json, is_pii) for one record's data_json"""
+    if not data_json.strip():
+        return '{}', False
     
-    # Redact phone numbers
-    for match in detector.phone_pattern.finditer(raw_str):
-        phone = match.group()
-        if len(phone) == 10:
-            masked = f"{phone[:2]}XXXXXX{phone[-2:]}"
-        else:
-            masked = f"{phone[:2]}{'X' * (len(phone) - 4)}{phone[-2:]}"
-        redacted = redacted.replace(phone, masked)
+    if not could_contain_pii(data_json):
+        return data_json, False
     
-    # Redact aadhar numbers
-    for match in detector.aadhar_pattern.finditer(raw_str):
-        aadhar = match.group()
-        clean_num = re.sub(r'[^\d]', '', aadhar)
-        if len(clean_num) == 12:
-            masked = f"{clean_num[:2]}XXXXXXXX{clean_num[-2:]}"
-            redacted = redacted.replace(aadhar, masked)
+    try:
+        data, dumps = json_loads(data_json)
+    except json.JSONDecodeError:
+        # Try to fix common JSON issues
+        fixed_json = fix_malformed_json(data_json)
+        try:
+            data, dumps = json_loads(fixed_json)
+        except:
+            # If still can't parse, scan the raw string for PII and redact it
+            if detect_pii_in_raw_string(data_json):
+                return redact_pii_in_raw_string(data_json), True
+            return data_json, False
     
-    # Redact passport numbers
-    redacted = detector.passport_pattern.sub('[REDACTED]', redacted)
+    has_pii, pii_fields = _detector.detect_pii_in_record(data)
     
-    # Redact UPI IDs
-    redacted = detector.upi_pattern.sub('[REDACTED]', redacted)
+    if has_pii:
+        # data was just parsed and is not shared, so redact it in place
+        for field, masked_value in pii_fields.items():
+            if field in data:
+                data[field] = masked_value
+        
+        redacted_json = dumps(data)
+        return redacted_json, True
+    return data_json, False
+
+def process_row(row):
+    record_id, data_json = row
+    try:
+        redacted_json, is_pii = process_record(data_json)
+        return record_id, redacted_json, is_pii
+    except Exception:
+        return record_id, '{}', False
+
+WRITE_BATCH_SIZE = 10000
+PARALLEL_MIN_ROWS = 10000
+PARALLEL_CHUNKSIZE = 1000
+
+def write_output_rows(writer, out_rows):
+    """Write output rows in batches; return (total_records, pii_records)"""
+    total_records = 0
+    pii_records = 0
+    batch = []
+    for out_row in out_rows:
+        total_records += 1
+        if out_row[2]:
+            pii_records += 1
+        batch.append(out_row)
+        if len(batch) >= WRITE_BATCH_SIZE:
+            writer.writerows(batch)
+            batch.clear()
+    writer.writerows(batch)
+    return total_records, pii_records
+
+def read_rows(infile):
+    """Yield (record_id, data_json) rows from an open input CSV"""
+    reader = csv.reader(infile)
+    header = next(reader, None)
+    if header == ['record_id', 'data_json']:
+        # Known column order: skip DictReader's per-row dict. Blank lines
+        # are skipped and short rows get None, as DictReader would do.
+        for row in reader:
+            if row:
+                yield row[0], row[1] if len(row) > 1 else None
+        return
     
-    # Redact emails
-    redacted = detector.email_pattern.sub('[REDACTED]', redacted)
+    infile.seek(0)
+    for row in csv.DictReader(infile):
+        yield row.get('record_id', ''), row.get('data_json', '{}')
+
+def count_lines(input_file):
+    """Cheap upper bound on the row count, read in 1 MiB binary blocks"""
+    with open(input_file, 'rb') as infile:
+        return sum(block.count(b'\n') for block in iter(lambda: infile.read(1 << 20), b''))
+
+def imap_in_windows(pool, func, rows, window):
+    """Pool.imap over rows, feeding at most `window` rows at a time.
     
-    return redacted
+    Pool.imap drains its whole input into the task queue up front; feeding
+    it window by window keeps memory bounded however large the input is.
+    """
+    while True:
+        block = list(islice(rows, window))
+        if not block:
+            return
+        yield from pool.imap(func, block, chunksize=PARALLEL_CHUNKSIZE)
 
 def process_csv_file(input_file):
-    detector = FlixkartPIIDetector()
     output_file = f"redacted_output_dhananjay_garg.csv"
     
-    total_records = 0
-    pii_records = 0
-    
     try:
         with open(input_file, 'r', encoding='utf-8') as infile:
-            reader = csv.DictReader(infile)
+            rows = read_rows(infile)
+            num_cpus = cpu_count()
             
-            with open(output_file, 'w', encoding='utf-8', newline='') as outfile:
+            with open(output_file, 'w', encoding='utf-8', newline='', buffering=1 << 20) as outfile:
                 writer = csv.writer(outfile)
                 writer.writerow(['record_id', 'redacted_data_json', 'is_pii'])
                 
-                for row in reader:
-                    total_records += 1
-                    
-                    try:
-                        record_id = row.get('record_id', '')
-                        data_json = row.get('data_json', '{}')
-                        
-                        if not data_json.strip():
-                            writer.writerow([record_id, '{}', False])
-                            continue
-                        
-                        try:
-                            data = json.loads(data_json)
-                        except json.JSONDecodeError:
-                            # Try to fix common JSON issues
-                            fixed_json = fix_malformed_json(data_json)
-                            try:
-                                data = json.loads(fixed_json)
-                            except:
-                                # If still can't parse, scan the raw string for PII and redact it
-                                has_pii_raw = detect_pii_in_raw_string(data_json)
-                                if has_pii_raw:
-                                    pii_records += 1
-                                    redacted_raw = redact_pii_in_raw_string(data_json)
-                                    writer.writerow([record_id, redacted_raw, True])
-                                else:
-                                    writer.writerow([record_id, data_json, False])
-                                continue
-                        
-                        has_pii, pii_fields = detector.detect_pii_in_record(data)
-                        
-                        if has_pii:
-                            pii_records += 1
-                            redacted_data = data.copy()
-                            for field, masked_value in pii_fields.items():
-                                if field in redacted_data:
-                                    redacted_data[field] = masked_value
-                            
-                            redacted_json = json.dumps(redacted_data, separators=(',', ':'))
-                            writer.writerow([record_id, redacted_json, True])
-                        else:
-                            writer.writerow([record_id, data_json, False])
-                    except Exception as e:
-                        writer.writerow([row.get('record_id', ''), '{}', False])
-                        continue
+                # A pool only pays for its start-up and per-row pickling when
+                # there are several cores and enough rows to share between them.
+                if num_cpus == 1 or count_lines(input_file) < PARALLEL_MIN_ROWS:
+                    total_records, pii_records = write_output_rows(writer, map(process_row, rows))
+                else:
+                    # imap keeps results in input order for the writer
+                    with Pool(num_cpus) as pool:
+                        total_records, pii_records = write_output_rows(
+                            writer, imap_in_windows(pool, process_row, rows, PARALLEL_CHUNKSIZE * num_cpus * 4))
     
     except FileNotFoundError:
         print(f"Error: File {input_file} not found")
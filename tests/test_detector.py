@@ -0,0 +1,127 @@
+import importlib.util
+import json
+import os
+import random
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import detector_full_dhananjay_garg as detector
+
+
+def load_detector(use_re2):
+    """Import a fresh copy of the detector with or without the re2 backend"""
+    saved = sys.modules.get('re2')
+    if not use_re2:
+        sys.modules['re2'] = None
+    try:
+        spec = importlib.util.spec_from_file_location(
+            f'detector_{"re2" if use_re2 else "re"}', os.path.join(ROOT, 'detector_full_dhananjay_garg.py'))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+    finally:
+        if saved is None:
+            sys.modules.pop('re2', None)
+        else:
+            sys.modules['re2'] = saved
+
+
+class RawStringRedactionTest(unittest.TestCase):
+
+    def test_upi_overlapping_aadhar_is_fully_redacted(self):
+        self.assertEqual(detector.redact_pii_in_raw_string('{"upi": "pay@1234 5678 9012"'),
+                         '{"upi": "[REDACTED]"')
+
+    def test_upi_overlapping_dashed_aadhar_is_fully_redacted(self):
+        self.assertEqual(detector.redact_pii_in_raw_string('x@0934-30571938'), '[REDACTED]')
+
+    def test_upi_with_phone_handle_is_fully_redacted(self):
+        self.assertEqual(detector.redact_pii_in_raw_string('pay 9876543210@ybl now'),
+                         'pay [REDACTED] now')
+
+    def test_phone_and_aadhar_are_masked(self):
+        self.assertEqual(detector.redact_pii_in_raw_string('9876543210 and 1234 5678 9012'),
+                         '98XXXXXX10 and 12XXXXXXXX12')
+
+    def test_no_pii_pattern_survives_redaction(self):
+        rng = random.Random(5)
+        alphabet = '0123456789 -@x.A'
+        patterns = [pattern for _, pattern in detector._RAW_PII_PATTERNS]
+        for _ in range(5000):
+            raw = ''.join(rng.choice(alphabet) for _ in range(rng.randint(5, 40)))
+            redacted = detector.redact_pii_in_raw_string(raw)
+            for pattern in patterns:
+                self.assertIsNone(pattern.search(redacted), (raw, redacted))
+
+
+class ProcessRecordTest(unittest.TestCase):
+
+    def test_process_row_works_without_a_pool(self):
+        record_id, redacted, is_pii = detector.process_row(('7', '{"phone": "9876543210"}'))
+        self.assertEqual((record_id, is_pii), ('7', True))
+        self.assertIn('98XXXXXX10', redacted)
+
+    def test_integers_beyond_64_bits_are_kept_exact(self):
+        data_json = ('{"order_value": 123456789012345678901234567890, '
+                     '"phone": 123456789012345678901234567890, "name": "Ravi Kumar", "email": "a@b.com"}')
+        redacted, is_pii = detector.process_record(data_json)
+        self.assertTrue(is_pii)
+        data = json.loads(redacted)
+        self.assertEqual(data['order_value'], 123456789012345678901234567890)
+        self.assertEqual(data['phone'], '12' + 'X' * 26 + '90')
+
+        for value in (-9223372036854775809, 18446744073709551616):
+            with self.subTest(value=value):
+                redacted, is_pii = detector.process_record(f'{{"phone":"9876543210","n":{value}}}')
+                self.assertTrue(is_pii)
+                self.assertEqual(json.loads(redacted)['n'], value)
+
+    def test_json_accepted_by_stdlib_is_not_treated_as_malformed(self):
+        cases = (('score', '-Infinity'), ('score', 'Infinity'), ('score', 'NaN'), ('s', '"\\ud83d"'))
+        for key, raw_value in cases:
+            with self.subTest(value=raw_value):
+                data_json = f'{{"name":"Ravi Kumar","email":"a@b.com","{key}":{raw_value}}}'
+                redacted, is_pii = detector.process_record(data_json)
+                self.assertTrue(is_pii)
+                self.assertEqual(redacted, json.dumps({'name': 'RXXX KXXXX', 'email': 'X@b.com',
+                                                       key: json.loads(raw_value)}, separators=(',', ':')))
+
+class RegexBackendTest(unittest.TestCase):
+
+    def backends(self):
+        backends = [('re', load_detector(use_re2=False))]
+        try:
+            import re2  # noqa: F401
+        except ImportError:
+            pass
+        else:
+            backends.append(('re2', load_detector(use_re2=True)))
+        return backends
+
+    def test_only_ascii_digits_count_as_pii_digits(self):
+        for name, module in self.backends():
+            with self.subTest(backend=name):
+                self.assertFalse(module.detect_pii_in_raw_string('{"phone": "\u096f\u096e\u096d\u096c\u096b\u096a\u0969\u0968\u0967\u0966"'))
+                self.assertFalse(module.FlixkartPIIDetector().is_standalone_pii('note', '\u0967\u0968\u0969\u096a' * 3))
+                self.assertTrue(module.detect_pii_in_raw_string('{"phone": "9876543210"'))
+                self.assertTrue(module.FlixkartPIIDetector().is_standalone_pii('note', '1234 5678 9012'))
+
+    def test_backends_agree(self):
+        backends = self.backends()
+        if len(backends) < 2:
+            self.skipTest('google-re2 is not installed')
+        (_, re_module), (_, re2_module) = backends
+        rng = random.Random(11)
+        alphabet = '0123456789 -@x.A_\u0967\u00e9\t'
+        for _ in range(3000):
+            raw = ''.join(rng.choice(alphabet) for _ in range(rng.randint(3, 30)))
+            self.assertEqual(re_module.redact_pii_in_raw_string(raw), re2_module.redact_pii_in_raw_string(raw), raw)
+            self.assertEqual(re_module.FlixkartPIIDetector().is_standalone_pii('note', raw.strip()),
+                             re2_module.FlixkartPIIDetector().is_standalone_pii('note', raw.strip()), raw)
+
+
+if __name__ == '__main__':
+    unittest.main()